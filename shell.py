@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
 import os, sys, signal
-import re, glob
+import re, glob, functools
 import readline
 
 version = "psh 0.091"
@@ -10,6 +10,13 @@ version = "psh 0.091"
 class Command:
     file_redirect_pattern = re.compile(r"(\d*>+$|<)")
     fd_redirect_pattern = re.compile(r"(\d+)>&(\d+)")
+    file_redirects = {
+        ">": ("stdout", os.O_CREAT | os.O_WRONLY | os.O_TRUNC),
+        "<": ("stdin", os.O_RDONLY),
+        ">>": ("stdout", os.O_CREAT | os.O_WRONLY | os.O_APPEND),
+        "2>": ("stderr", os.O_CREAT | os.O_WRONLY | os.O_TRUNC),
+        "2>>": ("stderr", os.O_CREAT | os.O_WRONLY | os.O_APPEND),
+    }
 
     def __init__(self, line):
         self.line = line
@@ -18,8 +25,7 @@ class Command:
         self.stderr = sys.stderr.fileno()
         self.line = os.path.expandvars(self.line)
         self.args = lex(self.line)
-        self.args = list([os.path.expanduser(token) for token in self.args])
-        self.args = glob_args(self.args)
+        self.args = expand_args(self.args)
         self.cmd = resolve_path(self.args[0])
         self.apply_redirects()
 
@@ -31,28 +37,22 @@ class Command:
     def apply_redirects(self):
         remove = []
         for index, arg in enumerate(self.args):
+            if ">" not in arg and "<" not in arg:
+                continue
             if self.file_redirect_pattern.match(arg):
                 self.apply_file_redirect(arg, self.args[index + 1])
                 remove.extend((index, index + 1))
             elif match := self.fd_redirect_pattern.match(arg):
-                fds = tuple([int(x) for x in match.groups()])
+                fds = tuple(map(int, match.groups()))
                 self.apply_fd_redirect(*fds)
                 remove.append(index)
         for index in remove[::-1]:
             del self.args[index]
 
     def apply_file_redirect(self, verb, filename):
-        match verb:
-            case ">":
-                self.stdout = os.open(filename, os.O_CREAT | os.O_WRONLY | os.O_TRUNC)
-            case "<":
-                self.stdin = os.open(filename, os.O_RDONLY)
-            case ">>":
-                self.stdout = os.open(filename, os.O_CREAT | os.O_WRONLY | os.O_APPEND)
-            case "2>":
-                self.stderr = os.open(filename, os.O_CREAT | os.O_WRONLY | os.O_TRUNC)
-            case "2>>":
-                self.stderr = os.open(filename, os.O_CREAT | os.O_WRONLY | os.O_APPEND)
+        if redirect := self.file_redirects.get(verb):
+            stream, flags = redirect
+            setattr(self, stream, os.open(filename, flags))
 
     def apply_fd_redirect(self, from_fd, to_fd):
         if from_fd == 1:
@@ -63,22 +63,28 @@ class Command:
             print(f"unsupported redirect {from_fd} to {to_fd}")
 
     def run(self):
-        pid = os.fork()
-        if pid == 0:
-            signal.signal(signal.SIGINT, signal.SIG_DFL)
-            os.dup2(self.stdin, sys.stdin.fileno())
-            os.dup2(self.stdout, sys.stdout.fileno())
-            os.dup2(self.stderr, sys.stderr.fileno())
-            os.execv(self.cmd, self.args)
-        else:
-            self.stdin == sys.stdin.fileno() or os.close(self.stdin)
-            self.stdout == sys.stdout.fileno() or self.stdout < 3 or os.close(
-                self.stdout
-            )
-            self.stderr == sys.stderr.fileno() or self.stderr < 3 or os.close(
-                self.stderr
+        file_actions = [
+            (os.POSIX_SPAWN_DUP2, self.stdin, sys.stdin.fileno()),
+            (os.POSIX_SPAWN_DUP2, self.stdout, sys.stdout.fileno()),
+            (os.POSIX_SPAWN_DUP2, self.stderr, sys.stderr.fileno()),
+        ]
+        try:
+            if self.cmd is None:
+                sys.stderr.write(f"{self.args[0]}: command not found\n")
+                return None
+            return os.posix_spawn(
+                self.cmd,
+                self.args,
+                os.environ,
+                file_actions=file_actions,
+                setsigdef=(signal.SIGINT, signal.SIGPIPE),
             )
-        return pid
+        except OSError as e:
+            sys.stderr.write(f"{self.args[0]}: {e.strerror}\n")
+            return None
+        finally:
+            for fd in {self.stdin, self.stdout, self.stderr}:
+                fd < 3 or os.close(fd)
 
 
 cwd_history = [os.getcwd()]
@@ -98,7 +104,8 @@ def chdir(newdir=os.path.expanduser("~")):
 
 def exit(status_code="0"):
     """shell builtin - exit()"""
-    retcode = int(status_code) & 0xFF if status_code.isnumeric() else 0
+    digits = status_code[1:] if status_code[:1] in "+-" else status_code
+    retcode = int(status_code) & 0xFF if digits.isdecimal() else 0
     sys.exit(retcode)
 
 
@@ -113,33 +120,58 @@ def lex(line):
     return line.strip().split()
 
 
+glob_chars = frozenset("*?[")
+
+
 def glob_args(arglist):
-    globbed = (glob.glob(token) or [token] for token in arglist)
-    return list([token for sublist in globbed for token in sublist])
+    globbed = (
+        (glob.glob(token) or [token]) if not glob_chars.isdisjoint(token) else [token]
+        for token in arglist
+    )
+    return [token for sublist in globbed for token in sublist]
+
+
+def expand_args(arglist):
+    return glob_args([os.path.expanduser(token) for token in arglist])
+
+
+path_cache = {}
 
 
 def resolve_path(progname):
     if progname[0] == "." and os.path.isfile(progname):
         return progname
 
-    for directory in os.environ["PATH"].split(":"):
+    search_path = os.environ["PATH"]
+    cached = path_cache.get((search_path, progname))
+    if cached and os.path.isfile(cached):
+        return cached
+
+    for directory in search_path.split(":"):
         testpath = os.path.join(directory, progname)
         if os.path.isfile(testpath):
+            if os.path.isabs(testpath):
+                path_cache[search_path, progname] = testpath
             return testpath
     return None
 
 
+@functools.cache
+def user_at_host():
+    return f"{os.getlogin()}@{os.uname().nodename}"
+
+
 def prompt():
     home = os.path.expanduser("~")
-    path = os.getcwd().replace(home, "~")
-    return f"{os.getlogin()}@{os.uname().nodename}:{path}$ "
+    path = os.getcwd()
+    if path == home or path.startswith(home + os.sep):
+        path = "~" + path[len(home) :]
+    return f"{user_at_host()}:{path}$ "
 
 
 def add_pipe_descriptors(commands):
-    i = 0
-    while i <= len(commands) - 2:
-        commands[i + 1].stdin, commands[i].stdout = os.pipe()
-        i += 1
+    for writer, reader in zip(commands, commands[1:]):
+        reader.stdin, writer.stdout = os.pipe()
 
 
 def process_line(line):
@@ -149,8 +181,7 @@ def process_line(line):
     first_token = tokens[0]
 
     if first_token in builtins:
-        tokens = [os.path.expanduser(token) for token in tokens]
-        tokens = glob_args(tokens)
+        tokens = expand_args(tokens)
         return builtins[first_token](*tokens[1:])
 
     commands = [Command(str) for str in pipesplit(line)]
@@ -159,15 +190,21 @@ def process_line(line):
     childprocs = []
     for command in commands:
         pid = command.run()
-        childprocs.append(pid)
+        if pid is not None:
+            childprocs.append(pid)
+
+    while childprocs:
+        (childpid, status) = os.wait()
+        childprocs.remove(childpid)
+        sig, ret = status & 0xFF, (status & 0xFF00) >> 8
+        if sig:
+            core, signum = sig & 0x80, sig & 0x7F
+            if signum == signal.SIGPIPE:
+                continue
+            print(f"{signal.Signals(signum).name}", "core dumped" if core else "")
+
 
-        while childprocs:
-            (childpid, status) = os.wait()
-            childprocs.remove(childpid)
-            sig, ret = status & 0xFF, (status & 0xFF00) >> 8
-            if sig:
-                core, signum = sig & 0x80, sig & 0x7F
-                print(f"{signal.Signals(signum).name}", "core dumped" if core else "")
+python_pattern = re.compile(r"\s*(eval|exec)\s*(.*)")
 
 
 def main():
@@ -176,7 +213,7 @@ def main():
         if not line:
             continue
 
-        result = re.search(r"^\s*(eval|exec)\s*(.*)", line)
+        result = line.startswith(("eval", "exec")) and python_pattern.match(line)
         if result and len(result.groups()) == 2:
             (verb, arg) = result.groups()
             if verb == "eval":